@@ -45,15 +45,19 @@ For the documentation below, the path of a CV is presented simply as a line.
 #  You should have received a copy of the GNU General Public License
 #  along with svgdigitizer. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
-import logging
+import re
 from functools import cached_property
+from math import isclose
 
-import matplotlib.pyplot as plt
 from astropy import units as u
 
 from svgdigitizer.svgfigure import SVGFigure
 
-logger = logging.getLogger("cv")
+# Splits the unit of the voltage axis such as `mV vs. RHE` into the
+# actual unit and the reference electrode.
+_REFERENCE_PATTERN = re.compile(
+    r"^(?P<unit>.+?)? *(?:(?:@|vs\.?) *(?P<reference>.+))?$", re.IGNORECASE
+)
 
 
 class CV(SVGFigure):
@@ -169,6 +173,9 @@ class CV(SVGFigure):
 
     """
 
+    _VOLTAGE_LABELS = frozenset(("U", "E"))
+    _CURRENT_LABELS = frozenset(("I", "j"))
+
     def __init__(
         self, svgplot, metadata=None, measurement_type="CV", force_si_units=False
     ):
@@ -178,16 +185,14 @@ class CV(SVGFigure):
             measurement_type=measurement_type,
             force_si_units=force_si_units,
         )
-        assert self.svgplot.xlabel in [
-            "U",
-            "E",
-        ], f"The y-label must be 'E' or 'U and not '{self.svgplot.xlabel}'."
-        assert self.svgplot.ylabel in [
-            "I",
-            "j",
-        ], f"The y-label must be 'I' or 'j and not '{self.svgplot.ylabel}'."
-
-    @property
+        assert (
+            self.svgplot.xlabel in self._VOLTAGE_LABELS
+        ), f"The y-label must be 'E' or 'U and not '{self.svgplot.xlabel}'."
+        assert (
+            self.svgplot.ylabel in self._CURRENT_LABELS
+        ), f"The y-label must be 'I' or 'j and not '{self.svgplot.ylabel}'."
+
+    @cached_property
     def data_schema(self):
         # TODO: use intersphinx to link Schema and Fields to frictionless docu (see #151).
         r"""
@@ -272,14 +277,20 @@ class CV(SVGFigure):
         """
         schema = super().data_schema
 
+        if not self.force_si_units:
+            return schema
+
         # astropy SI conversion turns `V` into `W / A` or `Ohm m`,
         # thus we need to set it manually to `V`.
-        if self.force_si_units:
-            if u.allclose(
-                1 * u.Unit(schema.get_field(self.svgplot.xlabel).custom["unit"]),
-                1 * u.V,  # pylint: disable=no-member
-            ):
-                schema.update_field(self.svgplot.xlabel, {"unit": "V"})
+        field = schema.get_field(self.svgplot.xlabel)
+
+        # Units that are not compatible with astropy are parsed into an
+        # UnrecognizedUnit which is not equivalent to anything.
+        unit = u.Unit(field.custom["unit"], parse_strict="silent")
+        volt = u.V  # pylint: disable=no-member
+        if unit.is_equivalent(volt) and isclose(unit.to(volt), 1):
+            field.custom["unit"] = "V"
+
         return schema
 
     @cached_property
@@ -327,29 +338,33 @@ class CV(SVGFigure):
                         {'name': 'j', 'type': 'number', 'unit': 'uA / cm2', 'orientation': 'y'}]}
 
         """
-        import re
-
-        from frictionless import Schema
-
-        schema = Schema.from_descriptor(super().figure_schema.to_dict())
-
-        pattern = r"^(?P<unit>.+?)? *(?:(?:@|vs\.?) *(?P<reference>.+))?$"
-        match = re.match(
-            pattern,
-            schema.get_field(self.svgplot.xlabel).custom["unit"],
-            re.IGNORECASE,
-        )
-
-        schema.update_field(
-            self.svgplot.xlabel,
-            {"unit": match[1], "reference": match[2] or "unknown"},
-        )
+        # The schema of the superclass is created freshly for this figure
+        # and only cached under the name of this property, so we can update
+        # it in place instead of creating a copy.
+        schema = super().figure_schema
+
+        field = schema.get_field(self.svgplot.xlabel)
+        unit = field.custom["unit"]
+        reference = None
+
+        # Only run the regular expression when the unit can contain a
+        # reference such as in `mV vs. RHE` or `mV @ RHE`.
+        if "@" in unit or "vs" in unit.lower():
+            match = _REFERENCE_PATTERN.match(unit)
+            unit, reference = match["unit"], match["reference"]
+        else:
+            # Drop trailing blanks just like the regular expression does.
+            unit = unit.rstrip(" ")
+
+        field.custom["unit"] = unit or None
+        field.custom["reference"] = reference if reference else "unknown"
 
         return schema
 
-    def plot(self):
+    def _plot_xlabel(self):
         r"""
-        Visualize the digitized cyclic voltammogram with values in SI units.
+        Return the label of the x-axis in :meth:`plot` which includes the
+        reference electrode.
 
         EXAMPLES::
 
@@ -365,11 +380,11 @@ class CV(SVGFigure):
             ...   </g>
             ...   <g>
             ...     <path d="M 0 200 L 0 100" />
-            ...     <text x="0" y="200">E1: 0 mV</text>
+            ...     <text x="0" y="200">E1: 0 mV vs. RHE</text>
             ...   </g>
             ...   <g>
             ...     <path d="M 100 200 L 100 100" />
-            ...     <text x="100" y="200">E2: 1 mV</text>
+            ...     <text x="100" y="200">E2: 1 mV vs. RHE</text>
             ...   </g>
             ...   <g>
             ...     <path d="M -100 100 L 0 100" />
@@ -379,26 +394,27 @@ class CV(SVGFigure):
             ...     <path d="M -100 0 L 0 0" />
             ...     <text x="-100" y="0">j2: 1 uA / cm2</text>
             ...   </g>
-            ...   <text x="-200" y="330">scan rate: 50 V/s</text>
             ... </svg>'''))
             >>> cv = CV(SVGPlot(svg))
-            >>> cv.plot()
+            >>> cv._plot_xlabel()
+            'E [mV vs. RHE]'
+
+        The label is used when plotting the CV::
+
+            >>> import matplotlib.pyplot as plt
+            >>> _, ax = plt.subplots()
+            >>> cv.plot(ax=ax)
+            >>> ax.get_xlabel()
+            'E [mV vs. RHE]'
 
         """
-        super().plot()
-
-        plt.xlabel(
-            self.svgplot.xlabel
-            + " ["
-            + self.xunit
-            + " vs. "
-            + self.data_schema.get_field(self.svgplot.xlabel).custom["reference"]
-            + "]"
-        )
+        reference = self.data_schema.get_field(self.svgplot.xlabel).custom["reference"]
+        return f"{self.svgplot.xlabel} [{self.xunit} vs. {reference}]"
 
 
 # Ensure that cached properties are tested, see
 # https://stackoverflow.com/questions/69178071/cached-property-doctest-is-not-detected/72500890#72500890
 __test__ = {
+    "CV.data_schema": CV.data_schema,
     "CV.figure_schema": CV.figure_schema,
 }
@@ -59,6 +59,7 @@ We can recover the specification of that segment as it is encoded in the SVG::
 # ********************************************************************
 import logging
 import re
+from functools import cached_property
 from xml.dom import Node, minidom
 
 logger = logging.getLogger("svg")
@@ -138,6 +139,8 @@ class SVG:
             [[Path "curve: 0"]]
 
         """
+        pattern = SVG._compile(pattern)
+
         labeled_paths = []
 
         groups = set(path.parentNode for path in self.svg.getElementsByTagName("path"))
@@ -190,7 +193,7 @@ class SVG:
             assert paths
 
             # Parse the label
-            match = re.match(pattern, SVG._text_value(label), re.IGNORECASE)
+            match = pattern.match(SVG._text_value(label))
             if match:
                 labeled_paths.append(LabeledPaths(label, paths, match))
 
@@ -220,15 +223,70 @@ class SVG:
             >>> curves[0].name
             '0'
 
+        The pattern can also be a precompiled regular expression. Note that
+        it is then matched with the flags it has been compiled with::
+
+            >>> import re
+            >>> curves = svg.get_texts(re.compile("CURVE: (?P<name>.*)", re.IGNORECASE))
+            >>> curves[0].name
+            '0'
+
         """
+        pattern = SVG._compile(pattern)
+
         labels = []
-        for text in self.svg.getElementsByTagName("text"):
-            match = re.match(pattern, SVG._text_value(text), re.IGNORECASE)
+        for text, value in self._texts:
+            match = pattern.match(value)
             if match:
                 labels.append(Text(text, match))
 
         return labels
 
+    @cached_property
+    def _texts(self):
+        r"""
+        Return all `<text>` elements of this SVG together with their text content.
+
+        Since many text fields are usually queried with :meth:`get_texts`,
+        the document is only traversed once to collect them.
+
+        EXAMPLES::
+
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 100 L 100 0" />
+            ...     <text x="0" y="0">curve: 0</text>
+            ...   </g>
+            ...   <text x="0" y="0">comment: noisy</text>
+            ... </svg>'''))
+            >>> [value for (text, value) in svg._texts]
+            ['curve: 0', 'comment: noisy']
+
+        """
+        return [
+            (text, SVG._text_value(text))
+            for text in self.svg.getElementsByTagName("text")
+        ]
+
+    @classmethod
+    def _compile(cls, pattern):
+        r"""
+        Return `pattern` as a compiled case-insensitive regular expression.
+
+        Patterns that have already been compiled are returned unchanged.
+
+        EXAMPLES::
+
+            >>> SVG._compile("curve")
+            re.compile('curve', re.IGNORECASE)
+
+        """
+        if isinstance(pattern, str):
+            return re.compile(pattern, re.IGNORECASE)
+        return pattern
+
     @classmethod
     def _get_transform(cls, element):
         r"""
@@ -644,3 +702,10 @@ class LabeledPath:
 
         """
         return f'Path "{self.label}"'
+
+
+# Ensure that cached properties are tested, see
+# https://stackoverflow.com/questions/69178071/cached-property-doctest-is-not-detected/72500890#72500890
+__test__ = {
+    "SVG._texts": SVG._texts,  # pylint: disable=protected-access
+}
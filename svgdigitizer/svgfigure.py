@@ -28,15 +28,68 @@ in the :doc:`documentation </usage>`.
 #  along with svgdigitizer. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
 import logging
-from functools import cached_property
+import re
+from functools import cached_property, lru_cache
 
 import astropy.units as u
-import matplotlib.pyplot as plt
+from mergedeep import merge
 
 from svgdigitizer.exceptions import SVGAnnotationError
 
 logger = logging.getLogger("svgfigure")
 
+# Patterns of the text fields in the SVG that carry metadata of the figure.
+_FIGURE_LABEL_PATTERN = re.compile(r"(?:figure): (?P<label>.+)", re.IGNORECASE)
+_CURVE_LABEL_PATTERN = re.compile(r"(?:curve): (?P<label>.+)", re.IGNORECASE)
+_SCAN_RATE_PATTERN = re.compile(
+    r"(?:scan rate): (?P<value>-?[0-9.]+) *(?P<unit>.*)", re.IGNORECASE
+)
+_COMMENT_PATTERN = re.compile(r"(?:comment): (?P<value>.*)", re.IGNORECASE)
+_TAGS_PATTERN = re.compile(r"(?:tags): (?P<value>.*)", re.IGNORECASE)
+_SIMULTANEOUS_MEASUREMENTS_PATTERN = re.compile(
+    r"(?:simultaneous measurement|linked|linked measurement): (?P<value>.*)",
+    re.IGNORECASE,
+)
+
+# Splits a comma separated list such as `BCV, HER` into its stripped items.
+_COMMA_PATTERN = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=256)
+def _si_unit(unit):
+    r"""
+    Return the SI unit corresponding to the astropy compatible `unit` string.
+
+    Since figures typically use a small number of different units, the
+    result is cached to not parse the same unit over and over again.
+
+    EXAMPLES::
+
+        >>> from svgdigitizer.svgfigure import _si_unit
+        >>> _si_unit("uA / cm2")
+        'A / m2'
+
+    """
+    return (1 * u.Unit(unit)).si.unit.to_string()
+
+
+@lru_cache(maxsize=256)
+def _si_scale(unit):
+    r"""
+    Return the factor that converts values in the astropy compatible `unit`
+    string into values in the corresponding SI unit.
+
+    EXAMPLES::
+
+        >>> from svgdigitizer.svgfigure import _si_scale
+        >>> _si_scale("mV")
+        0.001
+
+    """
+    # The scale is usually a float already, but astropy may also keep
+    # exact scales of composite units as fractions.
+    return float(u.Unit(unit).si.scale)
+
 
 class SVGFigure:
     """
@@ -195,6 +248,59 @@ class SVGFigure:
         """
         return self._measurement_type
 
+    def _first_text(self, pattern, description):
+        r"""
+        Return the first text field in the SVG matching `pattern` or
+        ``None`` if there is no such text field.
+
+        A warning mentioning the `description` of the text fields is
+        issued if more than one text field matches.
+
+        EXAMPLES::
+
+            >>> from svgdigitizer.svg import SVG
+            >>> from svgdigitizer.svgplot import SVGPlot
+            >>> from svgdigitizer.svgfigure import SVGFigure, _COMMENT_PATTERN, _TAGS_PATTERN
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 200 L 0 100" />
+            ...     <text x="0" y="200">x1: 0</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 100 200 L 100 100" />
+            ...     <text x="100" y="200">x2: 1</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 100 L 0 100" />
+            ...     <text x="-100" y="100">y1: 0</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 0 L 0 0" />
+            ...     <text x="-100" y="0">y2: 1</text>
+            ...   </g>
+            ...   <text x="-200" y="330">comment: noisy data</text>
+            ... </svg>'''))
+            >>> figure = SVGFigure(SVGPlot(svg))
+            >>> figure._first_text(_COMMENT_PATTERN, "comments")
+            <text>comment: noisy data</text>
+            >>> figure._first_text(_TAGS_PATTERN, "tags") is None
+            True
+
+        """
+        texts = self.svgplot.svg.get_texts(pattern)
+
+        if len(texts) > 1:
+            logger.warning(
+                f"More than one text field with {description}. Ignoring all text fields except for the first: {texts[0]}."
+            )
+
+        if not texts:
+            return None
+
+        return texts[0]
+
     @cached_property
     def figure_label(self):
         r"""
@@ -235,14 +341,9 @@ class SVGFigure:
             '2b'
 
         """
-        figure_labels = self.svgplot.svg.get_texts("(?:figure): (?P<label>.+)")
+        figure_label = self._first_text(_FIGURE_LABEL_PATTERN, "figure labels")
 
-        if len(figure_labels) > 1:
-            logger.warning(
-                f"More than one text field with figure labels. Ignoring all text fields except for the first: {figure_labels[0]}."
-            )
-
-        if not figure_labels:
+        if figure_label is None:
             figure_label = self._metadata.get("source", {}).get("figure", "")
             if not figure_label:
                 logger.warning(
@@ -250,7 +351,7 @@ class SVGFigure:
                 )
             return figure_label
 
-        return figure_labels[0].label
+        return figure_label.label
 
     @cached_property
     def curve_label(self):
@@ -295,17 +396,12 @@ class SVGFigure:
             'solid line'
 
         """
-        curve_labels = self.svgplot.svg.get_texts("(?:curve): (?P<label>.+)")
+        curve_label = self._first_text(_CURVE_LABEL_PATTERN, "curve labels")
 
-        if len(curve_labels) > 1:
-            logger.warning(
-                f"More than one text field with curve labels. Ignoring all text fields except for the first: {curve_labels[0]}."
-            )
-
-        if not curve_labels:
+        if curve_label is None:
             return self._metadata.get("source", {}).get("curve", "")
 
-        return curve_labels[0].label
+        return curve_label.label
 
     def _axis_unit(self, label):
         r"""Returns the unit of an axis with a specific label.
@@ -348,7 +444,7 @@ class SVGFigure:
 
         if self.force_si_units:
             if self.unit_is_astropy(unit):
-                return (1 * u.Unit(unit)).si.unit.to_string()
+                return _si_unit(unit)
 
         return unit
 
@@ -498,6 +594,51 @@ class SVGFigure:
         """
         return self._axis_unit(self.svgplot.ylabel)
 
+    @cached_property
+    def _astropy_xunit(self):
+        r"""
+        Return the unit of the x-axis as an astropy unit or ``None`` if the
+        unit is not compatible with astropy.
+
+        EXAMPLES::
+
+            >>> from svgdigitizer.svg import SVG
+            >>> from svgdigitizer.svgplot import SVGPlot
+            >>> from svgdigitizer.svgfigure import SVGFigure
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 100 L 100 0" />
+            ...     <text x="0" y="0">curve: solid line</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 0 200 L 0 100" />
+            ...     <text x="0" y="200">E1: 0 mV</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 100 200 L 100 100" />
+            ...     <text x="100" y="200">E2: 1 mV</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 100 L 0 100" />
+            ...     <text x="-100" y="100">j1: 0 A / cm2</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 0 L 0 0" />
+            ...     <text x="-100" y="0">j2: 1 A / cm2</text>
+            ...   </g>
+            ... </svg>'''))
+            >>> figure = SVGFigure(SVGPlot(svg))
+            >>> figure._astropy_xunit
+            Unit("mV")
+
+        """
+        if not self.unit_is_astropy(self.xunit):
+            return None
+
+        return u.Unit(self.xunit)
+
     @cached_property
     def comment(self):
         r"""
@@ -569,17 +710,12 @@ class SVGFigure:
             ''
 
         """
-        comments = self.svgplot.svg.get_texts("(?:comment): (?P<value>.*)")
-
-        if len(comments) > 1:
-            logger.warning(
-                f"More than one comment. Ignoring all comments except for the first: {comments[0]}."
-            )
+        comment = self._first_text(_COMMENT_PATTERN, "comments")
 
-        if not comments:
+        if comment is None:
             return self._metadata.get("figure description", {}).get("comment", "")
 
-        return comments[0].value
+        return comment.value
 
     @cached_property
     def df(self):
@@ -771,23 +907,31 @@ class SVGFigure:
             1  0.02  0.001  1.0
 
         """
-        df = self.svgplot.df.copy()
+        import pandas as pd
 
-        if self.force_si_units:
-            for column in df.columns:
-                column_unit = self.figure_schema.get_field(column).custom["unit"]
-                if self.unit_is_astropy(column_unit):
-                    self._convert_axis_to_si(df, column)
+        # The dataframe of the SVGPlot is cached and must not be modified.
+        # Instead of copying it as a whole first, we only copy the columns
+        # that are not replaced by a scaled version anyway.
+        source = self.svgplot.df
+        columns = {}
+
+        for column in source.columns:
+            column_unit = self.figure_schema.get_field(column).custom["unit"]
+            if self.force_si_units and self.unit_is_astropy(column_unit):
+                columns[column] = self._convert_axis_to_si(source, column)
+            else:
+                columns[column] = source[column].to_numpy(copy=True)
+
+        df = pd.DataFrame(columns, copy=False)
 
         if self.scan_rate is not None:
             self._add_time_axis(df)
-            return df[["t", self.svgplot.xlabel, self.svgplot.ylabel]]
 
-        return df[[self.svgplot.xlabel, self.svgplot.ylabel]]
+        return df
 
     def _convert_axis_to_si(self, df, label):
         r"""
-        Scales the values in a df into SI values.
+        Return the values of the column `label` of `df` scaled to SI units.
 
         EXAMPLES::
 
@@ -820,17 +964,20 @@ class SVGFigure:
             ...   <text x="-200" y="330">scan rate: 50 mV / s</text>
             ... </svg>'''))
             >>> figure = SVGFigure(SVGPlot(svg))
-            >>> figure._convert_axis_to_si(df = figure.svgplot.df.copy(), label='E')
+            >>> figure._convert_axis_to_si(df=figure.svgplot.df, label='E')
+            array([0.   , 0.001])
 
         """
-        quantity = 1 * u.Unit(self.figure_schema.get_field(label).custom["unit"])
-        # Convert the axis unit to SI units and use the value
-        # of the quantity to convert the original column data.
-        df[label] = df[label] * quantity.si.value
+        # Convert the axis unit to SI units and use the scale of the
+        # SI unit to convert the original column data.
+        return df[label].to_numpy() * _si_scale(
+            self.figure_schema.get_field(label).custom["unit"]
+        )
 
     def _add_time_axis(self, df):
         r"""
-        Add a time column to the dataframe `df`, based on the :property:`scan_rate`.
+        Add a time column as the first column of the dataframe `df`, based on
+        the :property:`scan_rate`.
 
         EXAMPLES::
 
@@ -865,17 +1012,50 @@ class SVGFigure:
             >>> plot = SVGFigure(SVGPlot(svg), force_si_units=True)
             >>> df = plot.svgplot.df.copy()
             >>> plot._add_time_axis(df)
+            >>> df
+                 t    E    j
+            0  0.0  0.0  0.0
+            1  2.0  1.0  1.0
 
-        """
-        x_quantity = 1 * u.Unit(self.xunit)
-        if self.force_si_units:
-            x_quantity = 1 * x_quantity.si.unit
+        The time axis has the precision of the x-axis::
 
-        factor = (x_quantity / (self.scan_rate)).decompose()
+            >>> df = plot.svgplot.df.astype("float32")
+            >>> plot._add_time_axis(df)
+            >>> df.dtypes["t"]
+            dtype('float32')
+
+        Integer data on the x-axis is promoted to floating point::
 
-        df["delta_x"] = abs(df[self.svgplot.xlabel].diff().fillna(0))
-        df["cumdelta_x"] = df["delta_x"].cumsum()
-        df["t"] = df["cumdelta_x"] * factor.value
+            >>> df = plot.svgplot.df.astype("int64")
+            >>> plot._add_time_axis(df)
+            >>> df.dtypes["t"]
+            dtype('float64')
+
+        """
+        import numpy
+
+        # The time in seconds needed to scan one unit on the x-axis. Note
+        # that the x-axis unit is already an SI unit with force_si_units.
+        factor = (self._astropy_xunit / self.scan_rate).to_value(u.s)
+
+        # The time axis has the precision of the x-axis. Only non-floating
+        # point data is promoted since the operations below work in place.
+        x = df[self.svgplot.xlabel].to_numpy()
+        if x.dtype.kind != "f":
+            x = x.astype(float)
+
+        # The time passed between two points is proportional to the distance
+        # travelled on the x-axis, irrespective of the scan direction.
+        # All steps operate in place on a single array that eventually holds
+        # the time axis to not allocate any temporary arrays.
+        t = numpy.empty_like(x)
+        t[:1] = 0
+        numpy.subtract(x[1:], x[:-1], out=t[1:])
+        numpy.abs(t, out=t)
+        numpy.cumsum(t, out=t)
+        t *= factor
+
+        df.insert(0, "t", t)
 
     @classmethod
     def unit_is_astropy(cls, unit):
@@ -948,9 +1128,7 @@ class SVGFigure:
             [<text>scan rate: 50 mV / s</text>]
 
         """
-        return self.svgplot.svg.get_texts(
-            "(?:scan rate): (?P<value>-?[0-9.]+) *(?P<unit>.*)"
-        )
+        return self.svgplot.svg.get_texts(_SCAN_RATE_PATTERN)
 
     @cached_property
     def scan_rate(self):
@@ -1066,7 +1244,7 @@ class SVGFigure:
         """
         # The scan rate is ignored when the unit on the x-axis is not compatible with astropy.
 
-        if not self.unit_is_astropy(self.xunit):
+        if self._astropy_xunit is None:
             logger.warning(
                 "Ignoring scan rate since unit on the x-axis is not compatible with astropy."
             )
@@ -1084,29 +1262,30 @@ class SVGFigure:
         if len(rates) == 0:
             rate = self._metadata.get("figure description", {}).get("scan rate", {})
 
-            def metadata_rate_consistency():
+            def metadata_rate_unit():
                 if "value" not in rate or "unit" not in rate:
                     logger.warning(
                         "No text with scan rate found in the SVG or provided metadata."
                     )
-                    return False
+                    return None
 
                 if not self.unit_is_astropy(rate["unit"]):
-                    return False
+                    return None
+
+                rate_unit = u.Unit(str(rate["unit"]))
 
-                if (
-                    not (1 * u.Unit(str(rate["unit"])) * u.s).si.unit
-                    == (1 * u.Unit(self.xunit)).si.unit
-                ):
+                if not self._scan_rate_unit_is_compatible(rate_unit):
                     logger.warning(
                         "The unit of the scan rate provided in the metadata is not compatible with the x-axis units."
                     )
-                    return False
+                    return None
+
+                return rate_unit
 
-                return True
+            rate_unit = metadata_rate_unit()
 
-            if metadata_rate_consistency():
-                return float(rate["value"]) * u.Unit(str(rate["unit"]))
+            if rate_unit is not None:
+                return float(rate["value"]) << rate_unit
 
             return None
 
@@ -1115,16 +1294,59 @@ class SVGFigure:
         if not self.unit_is_astropy(svg_rate_unit):
             return None
 
-        if (
-            not (1 * u.Unit(svg_rate_unit) * u.s).si.unit
-            == (1 * u.Unit(self.xunit)).si.unit
-        ):
+        svg_rate_unit = u.Unit(svg_rate_unit)
+
+        if not self._scan_rate_unit_is_compatible(svg_rate_unit):
             logger.warning(
                 "The unit of the scan rate provided in the SVG is not compatible with the x-axis units."
             )
             return None
 
-        return float(rates[0].value) * u.Unit(svg_rate_unit)
+        return float(rates[0].value) << svg_rate_unit
+
+    def _scan_rate_unit_is_compatible(self, unit):
+        r"""
+        Return whether a scan rate in the astropy `unit` integrated over time
+        yields the unit of the x-axis.
+
+        EXAMPLES::
+
+            >>> from svgdigitizer.svg import SVG
+            >>> from svgdigitizer.svgplot import SVGPlot
+            >>> from svgdigitizer.svgfigure import SVGFigure
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 100 L 100 0" />
+            ...     <text x="0" y="0">curve: 0</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 0 200 L 0 100" />
+            ...     <text x="0" y="200">x1: 0 mV</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 100 200 L 100 100" />
+            ...     <text x="100" y="200">x2: 1 mV</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 100 L 0 100" />
+            ...     <text x="-100" y="100">y1: 0 uA / cm2</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 0 L 0 0" />
+            ...     <text x="-100" y="0">y2: 1 uA / cm2</text>
+            ...   </g>
+            ... </svg>'''))
+            >>> figure = SVGFigure(SVGPlot(svg))
+            >>> from astropy import units as u
+            >>> figure._scan_rate_unit_is_compatible(u.Unit("V / s"))
+            True
+            >>> figure._scan_rate_unit_is_compatible(u.Unit("A / s"))
+            False
+
+        """
+        return (1 * unit * u.s).si.unit == (1 * self._astropy_xunit).si.unit
 
     @cached_property
     def data_schema(self):
@@ -1285,20 +1507,18 @@ class SVGFigure:
         from frictionless import Schema, fields
 
         schema = Schema.from_descriptor(self.figure_schema.to_dict())
-        for name in schema.field_names:
-            if "orientation" in schema.get_field(name).to_dict():
-                del schema.get_field(name).custom["orientation"]
+        for field in schema.fields:
+            field.custom.pop("orientation", None)
 
-        if self.force_si_units:
-            for name in schema.field_names:
-                field_unit = schema.get_field(name).custom["unit"]
+            if self.force_si_units:
+                field_unit = field.custom["unit"]
                 if self.unit_is_astropy(field_unit):
-                    si_unit = (1 * u.Unit(field_unit)).si.unit.to_string()
-                    schema.update_field(name, {"unit": si_unit})
+                    field.custom["unit"] = _si_unit(field_unit)
 
         if self.scan_rate is not None:
-            schema.add_field(fields.NumberField(name="t"))
-            schema.update_field("t", {"unit": "s"})
+            time = fields.NumberField(name="t")
+            time.custom["unit"] = "s"
+            schema.add_field(time)
 
         return schema
 
@@ -1383,15 +1603,16 @@ class SVGFigure:
         """
         from frictionless import Schema
 
+        # The schema of the SVGPlot is cached, so we work on a copy.
         schema = Schema.from_descriptor(self.svgplot.figure_schema.to_dict())
 
-        for field in schema.field_names:
-            if not schema.get_field(field).custom["unit"]:
-                schema.get_field(field).custom["unit"] = ""
+        for field in schema.fields:
+            if not field.custom["unit"]:
+                field.custom["unit"] = ""
 
         return schema
 
-    @property
+    @cached_property
     def tags(self):
         r"""
         A list of acronyms commonly used in the community to describe
@@ -1432,19 +1653,14 @@ class SVGFigure:
             ['BCV', 'HER', 'OER']
 
         """
-        tags = self.svgplot.svg.get_texts("(?:tags): (?P<value>.*)")
+        tags = self._first_text(_TAGS_PATTERN, "tags")
 
-        if len(tags) > 1:
-            logger.warning(
-                f"More than one text field with tags. Ignoring all text fields except for the first: {tags[0]}."
-            )
-
-        if not tags:
+        if tags is None:
             return self._metadata.get("experimental", {}).get("tags", [])
 
-        return [i.strip() for i in tags[0].value.split(",")]
+        return _COMMA_PATTERN.split(tags.value.strip())
 
-    @property
+    @cached_property
     def simultaneous_measurements(self):
         r"""
         A list of names of additional measurements which are plotted
@@ -1487,22 +1703,16 @@ class SVGFigure:
             ['SXRD', 'SHG']
 
         """
-        linked = self.svgplot.svg.get_texts(
-            "(?:simultaneous measurement|linked|linked measurement): (?P<value>.*)"
+        linked = self._first_text(
+            _SIMULTANEOUS_MEASUREMENTS_PATTERN, "linked measurements"
         )
 
-        if len(linked) > 1:
-            logger.warning(
-                f"More than one text field with linked measurements. Ignoring all text fields except for the first: {linked[0]}."
-            )
-
-        # if not linked:
-        if len(linked) == 0:
+        if linked is None:
             return self._metadata.get("figure description", {}).get(
                 "simultaneous measurements", []
             )
 
-        return [i.strip() for i in linked[0].value.split(",")]
+        return _COMMA_PATTERN.split(linked.value.strip())
 
     @property
     def metadata(self):
@@ -1612,6 +1822,13 @@ class SVGFigure:
             ...                       {'name': 'j', 'type': 'number', 'unit': 'uA / cm2'}]}}
             True
 
+        Each access returns a new dict, so modifying it does not change the
+        metadata of the figure::
+
+            >>> figure.metadata["source"]["curve"] = "modified"
+            >>> figure.metadata["source"]["curve"]
+            '0'
+
         """
         metadata = {
             "experimental": {
@@ -1646,13 +1863,14 @@ class SVGFigure:
                 },
             )
 
-        from mergedeep import merge
-
         return merge({}, self._metadata, metadata)
 
-    def plot(self):
+    def plot(self, ax=None):
         r"""Visualize the data in the figure.
 
+        The data is plotted into the matplotlib axes `ax` if given, and into
+        new axes otherwise.
+
         EXAMPLES::
 
             >>> from svgdigitizer.svg import SVG
@@ -1686,15 +1904,64 @@ class SVGFigure:
             >>> figure = SVGFigure(SVGPlot(svg))
             >>> figure.plot()
 
-        """
+        Plotting into existing axes, e.g., to combine several figures::
 
+            >>> import matplotlib.pyplot as plt
+            >>> _, ax = plt.subplots()
+            >>> figure.plot(ax=ax)
+            >>> ax.get_xlabel()
+            'E [V]'
+
+        """
+        # The labels are passed on to pandas which sets them on the axes it
+        # plots to, so we do not need to go through the global state of pyplot.
         self.df.plot(
+            ax=ax,
             x=self.svgplot.xlabel,
             y=self.svgplot.ylabel,
+            xlabel=self._plot_xlabel(),
+            ylabel=f"{self.svgplot.ylabel} [{self.yunit}]",
         )
 
-        plt.xlabel(self.svgplot.xlabel + " [" + self.xunit + "]")
-        plt.ylabel(self.svgplot.ylabel + " [" + self.yunit + "]")
+    def _plot_xlabel(self):
+        r"""
+        Return the label of the x-axis in :meth:`plot`.
+
+        EXAMPLES::
+
+            >>> from svgdigitizer.svg import SVG
+            >>> from svgdigitizer.svgplot import SVGPlot
+            >>> from svgdigitizer.svgfigure import SVGFigure
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 100 L 100 0" />
+            ...     <text x="0" y="0">curve: 0</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 0 200 L 0 100" />
+            ...     <text x="0" y="200">E1: 0 V</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 100 200 L 100 100" />
+            ...     <text x="100" y="200">E2: 1 V</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 100 L 0 100" />
+            ...     <text x="-100" y="100">j1: 0 A / cm2</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 0 L 0 0" />
+            ...     <text x="-100" y="0">j2: 1 A / cm2</text>
+            ...   </g>
+            ... </svg>'''))
+            >>> figure = SVGFigure(SVGPlot(svg))
+            >>> figure._plot_xlabel()
+            'E [V]'
+
+        """
+        return f"{self.svgplot.xlabel} [{self.xunit}]"
 
 
 # Ensure that cached properties are tested, see
@@ -1705,10 +1972,13 @@ __test__ = {
     "SVGFigure.curve_label": SVGFigure.curve_label,
     "SVGFigure.xunit": SVGFigure.xunit,
     "SVGFigure.yunit": SVGFigure.yunit,
+    "SVGFigure._astropy_xunit": SVGFigure._astropy_xunit,  # pylint: disable=protected-access
     "SVGFigure.comment": SVGFigure.comment,
     "SVGFigure.df": SVGFigure.df,
     "SVGFigure.scan_rate_labels": SVGFigure.scan_rate_labels,
     "SVGFigure.scan_rate": SVGFigure.scan_rate,
     "SVGFigure.data_schema": SVGFigure.data_schema,
     "SVGFigure.figure_schema": SVGFigure.figure_schema,
+    "SVGFigure.tags": SVGFigure.tags,
+    "SVGFigure.simultaneous_measurements": SVGFigure.simultaneous_measurements,
 }
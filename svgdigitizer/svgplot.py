@@ -1557,12 +1557,13 @@ class SVGPlot:
         }
 
         # Collect all labeled paths and warn if there is a label that we do not recognize.
+        recognized_labels = {
+            str(recognized_paths.label)
+            for pattern in patterns
+            for recognized_paths in labeled_paths[pattern]
+        }
         for paths in self.svg.get_labeled_paths():
-            if str(paths.label) not in [
-                str(recognized_paths.label)
-                for pattern in patterns
-                for recognized_paths in labeled_paths[pattern]
-            ]:
+            if str(paths.label) not in recognized_labels:
                 logger.warning(f"Ignoring <path> with unsupported label {paths.label}.")
 
         return labeled_paths
@@ -1920,7 +1921,7 @@ class SVGPlot:
         # a mix of numpy and Python data tyes.)
         return float(min(eligible_roots))
 
-    @property
+    @cached_property
     def figure_schema(self):
         # TODO: use intersphinx to link Schema and Fields to frictionless docu (see #151).
         """A frictionless `Schema` object, including a `Fields` object
@@ -2158,5 +2159,6 @@ __test__ = {
     "SVGPlot.transformation": SVGPlot.transformation,
     "SVGPlot.curve": SVGPlot.curve,
     "SVGPlot.labeled_paths": SVGPlot.labeled_paths,
+    "SVGPlot.figure_schema": SVGPlot.figure_schema,
     "SVGPlot.df": SVGPlot.df,
 }